@@ -0,0 +1,474 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import datetime
+from collections import namedtuple
+from src.visualizations import WorkoutVisualizer
+
+# Shared dashboard module: every page renders through render_dashboard so
+# the cached helpers below are registered (and hit) once per process,
+# instead of being duplicated per entry script.
+
+def get_unique_weeks(df):
+    if df is None or df.empty:
+        return []
+    # iso_year/iso_week are precomputed by the loader
+    return sorted(set(zip(df['iso_year'], df['iso_week'])), reverse=True)
+
+def weeks_diff(y1, w1, y2, w2):
+    d1 = datetime.datetime.fromisocalendar(y1, w1, 1)
+    d2 = datetime.datetime.fromisocalendar(y2, w2, 1)
+    return abs((d1 - d2).days) // 7
+
+def calculate_max_streak(df):
+    unique_weeks = get_unique_weeks(df)
+    if not unique_weeks:
+        return 0
+
+    max_streak = 1
+    current_run = 1
+
+    # Iterate through sorted weeks (descending)
+    # Check consecutive diffs
+    for i in range(len(unique_weeks) - 1):
+        y1, w1 = unique_weeks[i]
+        y2, w2 = unique_weeks[i+1]
+
+        if weeks_diff(y1, w1, y2, w2) == 1:
+            current_run += 1
+        else:
+            max_streak = max(max_streak, current_run)
+            current_run = 1
+
+    max_streak = max(max_streak, current_run)
+    return max_streak
+
+# Streak only changes when new workouts arrive, so hash the frame by its
+# shape and newest timestamp instead of content-hashing every rerun.
+@st.cache_data(hash_funcs={pd.DataFrame: lambda d: (len(d), str(d['start_time'].max()) if len(d) else '')})
+def calculate_current_streak(df):
+    if df is None or df.empty:
+        return 0
+
+    # Weekly periods ('W' = Mon-Sun, same as ISO weeks), newest first
+    weeks = pd.PeriodIndex(df['start_time'].dt.to_period('W').unique()).sort_values(ascending=False)
+
+    # Anchor to TODAY: the last workout must be this week or last week
+    current_week = pd.Timestamp.today().to_period('W')
+    if (current_week - weeks[0]).n > 1:
+        return 0
+
+    # Week-to-week gaps as plain integers; streak = leading run of 1s
+    gaps = -np.diff(weeks.asi8)
+    breaks = np.nonzero(gaps != 1)[0]
+    return int(breaks[0]) + 1 if len(breaks) else len(weeks)
+
+# Cached per-rerun computations
+# The loader df is itself cached, so its id() is stable across reruns and we
+# can skip hashing the full frame on every widget click.
+@st.cache_data(hash_funcs={pd.DataFrame: id})
+def compute_filtered(df, filter_year, filter_routine):
+    """Apply the sidebar filters once per unique (year, routine) pair."""
+    # The frame is sorted by start_time, so the year filter is a binary
+    # search + zero-copy slice instead of a boolean scan
+    if filter_year:
+        ts = df['start_time'].values
+        lo = np.searchsorted(ts, np.datetime64(f'{int(filter_year)}-01-01'))
+        hi = np.searchsorted(ts, np.datetime64(f'{int(filter_year) + 1}-01-01'))
+        df = df.iloc[lo:hi]
+    if filter_routine:
+        df = df[df['routine_name'].values == filter_routine]
+    return df
+
+Kpis = namedtuple('Kpis', [
+    'total_vol', 'total_workouts', 'total_sets', 'total_reps',
+    'total_hours', 'avg_sets_workout', 'avg_duration_mins',
+    'unknown_exercises'
+])
+
+@st.cache_data(hash_funcs={pd.DataFrame: id})
+def compute_kpis(df, workouts, filter_year, filter_routine):
+    """Aggregate the KPI scalars for the current filtered view.
+
+    Keyed on the filter tuple (not the filtered frame) because cache_data
+    returns a fresh copy per call, whose id() would never repeat.
+    """
+    filtered_df = compute_filtered(df, filter_year, filter_routine)
+    # One fused aggregation pass over the per-set columns
+    sums = filtered_df[['volume', 'reps']].agg('sum')
+    total_vol = sums['volume'] / 1000 # tonnes
+    total_sets = len(filtered_df)
+    total_reps = int(sums['reps'])
+
+    # Workout count / duration come from the compact per-workout table
+    workouts_f = workouts
+    if filter_year:
+        workouts_f = workouts_f[workouts_f['year'] == filter_year]
+    if filter_routine:
+        workouts_f = workouts_f[workouts_f['routine_name'] == filter_routine]
+    total_workouts = np.unique(workouts_f['day'].values).size
+    total_seconds = workouts_f['duration_s'].sum()
+    total_hours = total_seconds / 3600
+
+    avg_sets_workout = total_sets / total_workouts if total_workouts > 0 else 0
+    avg_duration_mins = (total_seconds / 60) / total_workouts if total_workouts > 0 else 0
+
+    # Unknown-exercise check rides along in the same cached pass; the
+    # categorical == is a single code comparison
+    unknown_exercises = tuple(
+        filtered_df.loc[filtered_df['muscle_group'] == 'unknown', 'exercise_title'].unique()
+    )
+
+    return Kpis(total_vol, total_workouts, total_sets, total_reps,
+                total_hours, avg_sets_workout, avg_duration_mins,
+                unknown_exercises)
+
+# Visualizer, cached per filter pair so reruns reuse the same instance
+# (the _loader arg is skipped from hashing by the leading underscore)
+@st.cache_resource
+def get_visualizer(_loader, filter_year, filter_routine):
+    filtered = compute_filtered(_loader.workout_data, filter_year, filter_routine)
+    return WorkoutVisualizer(filtered, _loader.bodyweight_data, _loader.phases_data)
+
+# The figure only depends on (metric, year, group, routine); the visualizer
+# itself is derived from those filters, so keep it out of the cache key.
+@st.cache_data(hash_funcs={WorkoutVisualizer: lambda v: None})
+def get_chart(viz_obj, metric_name, year, group=None, routine=None):
+    if metric_name == "Total Volume":
+        if group:
+            return viz_obj.create_monthly_specific_muscle_chart(year, filter_group=group)
+        else:
+            return viz_obj.create_monthly_volume_chart(year)
+    else:
+        # Avg per Workout
+        return viz_obj.create_monthly_volume_per_workout_chart(year, filter_group=group)
+
+def render_dashboard(loader):
+    """Render the full dashboard (sidebar, KPIs, charts) for a loaded dataset."""
+    df = loader.workout_data
+    bw_df = loader.bodyweight_data
+    phases_df = loader.phases_data
+
+    # Sidebar
+    st.sidebar.title("HevyStats")
+    st.sidebar.markdown("Advanced analytics for your Hevy workouts.")
+
+    # Filters
+    available_years = loader.available_years
+    selected_year = st.sidebar.selectbox("Select Year", ["All Time"] + available_years)
+
+    # Routine Filter: routines sorted by most recent first (precomputed in loader)
+    routine_order = loader.routine_order
+    available_routines = ["All Splits"] + routine_order
+
+    # Default index logic: Select the most recent split (index 1) if available
+    default_idx = 1 if len(available_routines) > 1 else 0
+    selected_routine = st.sidebar.selectbox("Select Split", available_routines, index=default_idx)
+
+    filter_year = None if selected_year == "All Time" else selected_year
+    filter_routine = None if selected_routine == "All Splits" else selected_routine
+
+    # Filter dataset for calculations (cached per filter combination)
+    filtered_df = compute_filtered(df, filter_year, filter_routine)
+
+    viz = get_visualizer(loader, filter_year, filter_routine)
+
+    # Logic for Streak: Current vs Max
+    # 1. Historical Year
+    is_historical = False
+    current_year_val = datetime.date.today().year
+
+    if filter_year and filter_year < current_year_val:
+        is_historical = True
+    elif filter_routine:
+        # Check if routine is "active" (last workout within 14 days)
+        # OR simpler: check if the routine's last workout is significantly in the past
+        last_routine_date = filtered_df['start_time'].max().date()
+        days_since_last = (datetime.date.today() - last_routine_date).days
+        if days_since_last > 14: # Threshold for "Old Routine"
+            is_historical = True
+
+    if is_historical:
+        streak_val = calculate_max_streak(filtered_df)
+        streak_label = "Max Streak"
+    else:
+        streak_val = calculate_current_streak(filtered_df)
+        streak_label = "Weekly Streak"
+
+    # Main Dashboard
+    # st.title("Hevy Stats")
+    st.markdown("""
+    <style>
+    @keyframes gradient {
+        0% { background-position: 0% 50%; }
+        50% { background-position: 100% 50%; }
+        100% { background-position: 0% 50%; }
+    }
+    .header {
+        background: linear-gradient(-45deg, #ee7752, #e73c7e, #23a6d5, #23d5ab);
+        background-size: 400% 400%;
+        animation: gradient 15s ease infinite;
+        padding: 30px;
+        border-radius: 15px;
+        text-align: center;
+        color: white;
+        margin-bottom: 30px;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+    }
+    .header h1 {
+        margin: 0;
+        font-size: 3.5rem;
+        font-weight: 700;
+        color: white;
+        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+        font-family: sans-serif;
+    }
+    .header p {
+        font-size: 1.2rem;
+        opacity: 0.9;
+        margin-top: 5px;
+    }
+    </style>
+    <div class="header">
+        <h1>Hevy Stats</h1>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+    # Show active filters
+    active_filters = []
+    if filter_year:
+        active_filters.append(f"**Year:** {filter_year}")
+    if filter_routine:
+        active_filters.append(f"**Split:** {filter_routine}")
+
+    if active_filters:
+        st.markdown(f"#### {' • '.join(active_filters)}")
+
+    # Metric Calculations (cached per filter combination)
+    kpis = compute_kpis(df, loader.workouts, filter_year, filter_routine)
+
+    # KPI Row 1
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total Volume", f"{kpis.total_vol:.1f} t")
+    col2.metric("Workouts", kpis.total_workouts)
+    col3.metric("Hours", f"{kpis.total_hours:.1f} h")
+    col4.metric("Total Sets", f"{kpis.total_sets}")
+
+    # KPI Row 2
+    col5, col6, col7, col8 = st.columns(4)
+    col5.metric("Total Reps", f"{kpis.total_reps}")
+    col6.metric("Avg Sets/Workout", f"{kpis.avg_sets_workout:.1f}")
+    col7.metric("Avg Duration", f"{kpis.avg_duration_mins:.0f} min")
+    col8.metric(streak_label, f"{streak_val} 🔥")
+
+    # Check for unknown exercises (computed inside the cached KPI pass)
+    unknown_exercises = kpis.unknown_exercises
+    if len(unknown_exercises) > 0:
+        st.warning(
+            f"⚠️ Found {len(unknown_exercises)} exercises with unknown muscle group: "
+            f"{', '.join(unknown_exercises)}. Please update `exercise_database.json`."
+        )
+
+    st.divider()
+
+    # Consistency Heatmap
+    st.subheader("Workout Consistency 📅")
+    fig_heatmap = viz.create_consistency_heatmap(year=filter_year)
+    if fig_heatmap:
+        st.plotly_chart(fig_heatmap, width="stretch")
+    else:
+        st.info("No data available for consistency heatmap.")
+
+    st.divider()
+
+    # Charts
+    st.subheader("Training Volume History 📊")
+
+    # Metric Selection
+    metric = st.radio(
+        "Metric",
+        ["Avg Volume per Workout", "Total Volume"],
+        horizontal=True,
+        label_visibility="collapsed"
+    )
+
+    # Group selector: Overall + specific major groups that have sub-muscles.
+    # A radio (instead of st.tabs) means only the active group's figure is
+    # built and serialized per rerun, not all seven.
+    group_options = ["Overall", "Arms", "Legs", "Back", "Chest", "Shoulders", "Core"]
+    selected_group_tab = st.radio(
+        "Group",
+        group_options,
+        horizontal=True,
+        key='group_tab',
+        label_visibility="collapsed"
+    )
+
+    group_filter = None if selected_group_tab == "Overall" else selected_group_tab.lower()
+    fig_vol = get_chart(viz, metric, filter_year, group=group_filter, routine=filter_routine)
+    if fig_vol:
+        st.plotly_chart(fig_vol, width="stretch")
+    else:
+        st.info(f"No data available for {selected_group_tab}.")
+
+    st.divider()
+
+    # Muscle Balance Radar
+    st.subheader("Muscle Balance 🕸️")
+
+    # Comparison Datasets
+    comparison_dfs = []
+
+    # 1. Historical Average (All Time from full DF)
+    # We can just use the full 'df' as historical reference
+    comparison_dfs.append({
+        'df': df,
+        'label': 'Historical Avg',
+        'color': 'rgba(128, 128, 128, 0.5)' # Grey
+    })
+
+    # 2. Previous Routine (If a routine is selected)
+    prev_routine_name = None
+    if filter_routine:
+        # routine_order is defined at top: sorted by recent first
+        if filter_routine in routine_order:
+            curr_idx = routine_order.index(filter_routine)
+            # Check if there is a next one (which is OLDER in time)
+            if curr_idx + 1 < len(routine_order):
+                prev_routine_name = routine_order[curr_idx + 1]
+                prev_df = df[df['routine_name'] == prev_routine_name]
+                if not prev_df.empty:
+                    comparison_dfs.append({
+                        'df': prev_df,
+                        'label': f"Prev: {prev_routine_name}",
+                        'color': 'rgba(54, 162, 235, 0.6)' # Blue-ish
+                    })
+
+    # Create Radar
+    fig_radar = viz.create_muscle_balance_radar(
+        current_df=filtered_df, # The currently filtered view (e.g. Current Routine or Year)
+        comparison_dfs=comparison_dfs,
+        title=f"Muscle Balance: {filter_routine if filter_routine else 'Active View'} vs History"
+    )
+
+    if fig_radar:
+        st.plotly_chart(fig_radar, width="stretch")
+    else:
+        st.info("Not enough data for Radar Chart.")
+
+    st.divider()
+
+    # Exercise Progression Analysis
+    st.subheader("Exercise Analysis 📈")
+
+    # Filter exercises: Must have at least a dynamic number of sessions
+    # Logic: approx once every 2 weeks, min 2, max 10
+    if filtered_df.empty:
+        days_range = 0
+    else:
+        days_range = (filtered_df['start_time'].max() - filtered_df['start_time'].min()).days
+
+    # Calculate threshold: 1 session per 14 days, min 2, capped at 10
+    calculated_threshold = max(2, int(days_range // 14))
+    min_sessions = min(10, calculated_threshold)
+
+    # We first get valid exercises, then enrich with muscle group for hierarchical selection
+    # Count distinct (exercise, workout) pairs; cheaper than a per-group
+    # nunique which builds a hash set inside every group
+    ex_counts = filtered_df[['exercise_title', 'start_time']].drop_duplicates()['exercise_title'].value_counts()
+    valid_exercises_list = ex_counts.index[ex_counts >= min_sessions].tolist()
+
+    if not valid_exercises_list:
+        st.info(f"No exercises found with at least {min_sessions} sessions in this period.")
+        selected_exercise = None
+    else:
+        # Create a subset DF for valid exercises
+        valid_df = filtered_df[filtered_df['exercise_title'].isin(valid_exercises_list)][['exercise_title', 'muscle_group']].drop_duplicates()
+
+        # 1. Select Group (Use specific muscle group directly)
+        available_groups = sorted(valid_df['muscle_group'].unique())
+
+        # Initialize Session State using available_groups[0] if needed
+        if 'selected_group_nav' not in st.session_state:
+            st.session_state.selected_group_nav = available_groups[0]
+        elif st.session_state.selected_group_nav not in available_groups:
+            st.session_state.selected_group_nav = available_groups[0]
+
+        # O(1) position lookups for the nav callbacks
+        group_idx = {name: i for i, name in enumerate(available_groups)}
+
+        def prev_group():
+            curr_idx = group_idx.get(st.session_state.selected_group_nav)
+            if curr_idx is not None:
+                new_idx = (curr_idx - 1) % len(available_groups)
+                st.session_state.selected_group_nav = available_groups[new_idx]
+
+        def next_group():
+            curr_idx = group_idx.get(st.session_state.selected_group_nav)
+            if curr_idx is not None:
+                new_idx = (curr_idx + 1) % len(available_groups)
+                st.session_state.selected_group_nav = available_groups[new_idx]
+
+        # Layout: [ < ] [ Selectbox ] [ > ]
+        col_g1, col_g2, col_g3 = st.columns([1, 10, 1])
+        with col_g1:
+            st.write("")
+            st.write("")
+            st.button("⬅️", key="btn_prev_group", on_click=prev_group, help="Previous Group")
+        with col_g2:
+            selected_group = st.selectbox(
+                "Select Muscle Group",
+                available_groups,
+                key='selected_group_nav',
+                format_func=lambda x: x.replace('_', ' ').title()
+            )
+        with col_g3:
+            st.write("")
+            st.write("")
+            st.button("➡️", key="btn_next_group", on_click=next_group, help="Next Group")
+
+        # 2. Select Exercise (Filtered by Group)
+        exercises_in_group = valid_df[valid_df['muscle_group'] == selected_group]['exercise_title'].sort_values().tolist()
+
+        # Initialize or Validate Session State for Navigation
+        if 'selected_exercise_nav' not in st.session_state:
+            st.session_state.selected_exercise_nav = exercises_in_group[0]
+        elif st.session_state.selected_exercise_nav not in exercises_in_group:
+            # If group changed or filtered list changed, reset to first item
+            st.session_state.selected_exercise_nav = exercises_in_group[0]
+
+        # Navigation Callbacks (dict lookup instead of a list scan per click)
+        ex_idx = {name: i for i, name in enumerate(exercises_in_group)}
+
+        def prev_ex():
+            curr_idx = ex_idx.get(st.session_state.selected_exercise_nav)
+            if curr_idx is not None:
+                new_idx = (curr_idx - 1) % len(exercises_in_group)
+                st.session_state.selected_exercise_nav = exercises_in_group[new_idx]
+
+        def next_ex():
+            curr_idx = ex_idx.get(st.session_state.selected_exercise_nav)
+            if curr_idx is not None:
+                new_idx = (curr_idx + 1) % len(exercises_in_group)
+                st.session_state.selected_exercise_nav = exercises_in_group[new_idx]
+
+        # Layout: [ < ] [ Selectbox ] [ > ]
+        c1, c2, c3 = st.columns([1, 10, 1])
+        with c1:
+            st.write("") # Spacer to align with label?
+            st.write("")
+            st.button("⬅️", on_click=prev_ex, help="Previous Exercise")
+        with c2:
+            selected_exercise = st.selectbox("Select Exercise", exercises_in_group, key='selected_exercise_nav')
+        with c3:
+            st.write("")
+            st.write("")
+            st.button("➡️", on_click=next_ex, help="Next Exercise")
+
+    if selected_exercise:
+        fig_prog = viz.create_exercise_progression_chart(selected_exercise)
+        if fig_prog:
+            st.plotly_chart(fig_prog, use_container_width=True)
+        else:
+            st.info("No data for this exercise in the selected period.")
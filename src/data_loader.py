@@ -1,75 +1,190 @@
 import pandas as pd
+import numpy as np
+import hashlib
 import json
 from pathlib import Path
 
+from .const import GROUP_MAPPING, MUSCLE_GROUP_ORDER
+
+# Columns of the Hevy export that the pipeline actually uses; the rest
+# (title, description, notes, ...) would only pad every downstream copy
+WORKOUT_COLUMNS = [
+    'exercise_title', 'set_type', 'start_time', 'end_time',
+    'weight_kg', 'reps', 'distance_km', 'duration_seconds', 'rpe',
+]
+
+
 class HevyDataLoader:
     def __init__(self, data_dir='data'):
         self.data_dir = Path(data_dir)
         self.workout_data = None
         self.exercise_database = None
+        self.exercise_meta_df = None
         self.excluded_exercises = None
         self.bodyweight_data = None
+        self._bw_dates = None
+        self._bw_weights = None
         self.phases_data = None
         self.gym_data = None
         self.routines_data = None
+        self.workouts = None
+        self.available_years = None
+        self.routine_order = None
+
+    # Input files whose mtimes key the processed-frame cache
+    _INPUT_FILES = [
+        'workout_data.csv', 'bodyweight_data.csv', 'body_composition_phases.csv',
+        'gyms.csv', 'routine.csv', 'exercise_database.json',
+    ]
 
     def load_all(self):
         """Loads all necessary data files."""
         self.load_exercise_database(self.data_dir / 'exercise_database.json')
-        self.load_workout_data(self.data_dir / 'workout_data.csv')
         # Optional files - fail gracefully or warn if missing, but for now we expect them
         self.load_bodyweight_data(self.data_dir / 'bodyweight_data.csv')
         self.load_body_composition_phases(self.data_dir / 'body_composition_phases.csv')
         self.load_gym_data(self.data_dir / 'gyms.csv')
         self.load_routine_data(self.data_dir / 'routine.csv')
-        
+
+        # Processed-frame cache: Parquet keyed by input mtimes skips the
+        # CSV parse and the whole processing pipeline on app restarts
+        cache_path = self._processed_cache_path()
+        if cache_path.exists():
+            self.workout_data = pd.read_parquet(cache_path)
+            self._build_summary_tables()
+            return
+
+        self.load_workout_data(self.data_dir / 'workout_data.csv')
         self.process_data()
 
+        cache_path.parent.mkdir(exist_ok=True)
+        for stale in cache_path.parent.glob('processed_*.parquet'):
+            stale.unlink()
+        self.workout_data.to_parquet(cache_path)
+
+    def _processed_cache_path(self):
+        """Cache file path for the current set of input files."""
+        mtimes = '-'.join(
+            str((self.data_dir / name).stat().st_mtime_ns)
+            if (self.data_dir / name).exists() else '0'
+            for name in self._INPUT_FILES
+        )
+        key = hashlib.md5(mtimes.encode()).hexdigest()[:16]
+        return self.data_dir / '.cache' / f'processed_{key}.parquet'
+
     def load_workout_data(self, csv_path):
         if not csv_path.exists():
             raise FileNotFoundError(f"Workout data not found at {csv_path}")
             
-        self.workout_data = pd.read_csv(csv_path)
-        
-        # Convert datetime columns
-        # Hevy export format: "10 Oct 2023, 12:00"
-        self.workout_data['start_time'] = pd.to_datetime(self.workout_data['start_time'], format='%d %b %Y, %H:%M')
-        self.workout_data['end_time'] = pd.to_datetime(self.workout_data['end_time'], format='%d %b %Y, %H:%M')
-        
-        # Clean numeric columns
-        numeric_columns = ['weight_kg', 'reps', 'distance_km', 'duration_seconds', 'rpe']
-        for col in numeric_columns:
+        # The pyarrow engine tokenizes the CSV across threads; float32 for
+        # the numerics (plenty for set weights/reps, half the bandwidth).
+        # Absent dtype keys are simply ignored. The Hevy export format
+        # ("10 Oct 2023, 12:00") is not ISO, so the datetimes are parsed
+        # in a second vectorized pass — pyarrow can't take a date_format.
+        self.workout_data = pd.read_csv(
+            csv_path,
+            engine='pyarrow',
+            usecols=WORKOUT_COLUMNS,
+            dtype={
+                'weight_kg': 'float32',
+                'reps': 'float32',
+                'distance_km': 'float32',
+                'duration_seconds': 'float32',
+                'rpe': 'float32',
+            },
+        )
+        for col in ('start_time', 'end_time'):
+            self.workout_data[col] = pd.to_datetime(
+                self.workout_data[col], format='%d %b %Y, %H:%M', cache=True
+            )
+
+        # Repetitive raw string columns: category codes turn the filter
+        # masks below into integer compares and shrink the frame
+        for col in ('exercise_title', 'set_type'):
             if col in self.workout_data.columns:
-                self.workout_data[col] = pd.to_numeric(self.workout_data[col], errors='coerce')
+                self.workout_data[col] = self.workout_data[col].astype('category')
 
     def load_exercise_database(self, json_path):
         if not json_path.exists():
             print(f"Warning: Exercise database not found at {json_path}")
             self.exercise_database = {}
-            self.excluded_exercises = set()
+            self.excluded_exercises = frozenset()
+            self.exercise_meta_df = None
+            return
+
+        # Materialized Parquet sidecar: read it when it is at least as new
+        # as the JSON, skipping JSON decoding and dict construction
+        pq_path = json_path.with_suffix('.parquet')
+        if pq_path.exists() and pq_path.stat().st_mtime >= json_path.stat().st_mtime:
+            table = pd.read_parquet(pq_path)
+            excluded = table['excluded'].to_numpy()
+            self.exercise_database = {}  # only materialized on the JSON path
+            self.excluded_exercises = frozenset(table.loc[excluded, 'exercise_title'])
+            meta = table.loc[
+                ~excluded, ['exercise_title', 'muscle_group', 'weight_type', 'gym_dependent']
+            ].reset_index(drop=True)
+            self.exercise_meta_df = meta if not meta.empty else None
             return
 
         with open(json_path, 'r') as f:
             data = json.load(f)
-        
+
         self.exercise_database = data.get('exercises', {})
-        self.excluded_exercises = set(data.get('excluded_exercises', []))
+        self.excluded_exercises = frozenset(data.get('excluded_exercises', []))
+
+        # Metadata as a frame keyed by exercise: one left-merge fills all
+        # three columns (one hash build + probe instead of three map passes)
+        if self.exercise_database:
+            self.exercise_meta_df = (
+                pd.DataFrame.from_dict(self.exercise_database, orient='index')
+                .reindex(columns=['muscle_group', 'weight_type', 'gym_dependent'])
+                .rename_axis('exercise_title')
+                .reset_index()
+            )
+        else:
+            self.exercise_meta_df = None
+
+        # Refresh the sidecar for the next start
+        table = (
+            self.exercise_meta_df.assign(excluded=False)
+            if self.exercise_meta_df is not None
+            else pd.DataFrame(columns=['exercise_title', 'muscle_group',
+                                       'weight_type', 'gym_dependent', 'excluded'])
+        )
+        if self.excluded_exercises:
+            table = pd.concat(
+                [table, pd.DataFrame({'exercise_title': sorted(self.excluded_exercises),
+                                      'excluded': True})],
+                ignore_index=True,
+            )
+        table.to_parquet(pq_path)
 
     def load_bodyweight_data(self, csv_path):
         if csv_path.exists():
             self.bodyweight_data = pd.read_csv(csv_path)
-            self.bodyweight_data['date'] = pd.to_datetime(self.bodyweight_data['date'])
+            self.bodyweight_data['date'] = pd.to_datetime(
+                self.bodyweight_data['date'], format='ISO8601', cache=True
+            )
+            self.bodyweight_data = self.bodyweight_data.sort_values('date')
+            # Cached arrays let get_bodyweight_for_date binary search
+            # instead of masking the whole frame per call
+            self._bw_dates = self.bodyweight_data['date'].to_numpy()
+            self._bw_weights = self.bodyweight_data['weight_kg'].to_numpy()
 
     def load_body_composition_phases(self, csv_path):
         if csv_path.exists():
             self.phases_data = pd.read_csv(csv_path)
-            self.phases_data['date'] = pd.to_datetime(self.phases_data['date'])
+            self.phases_data['date'] = pd.to_datetime(
+                self.phases_data['date'], format='ISO8601', cache=True
+            )
             self.phases_data = self.phases_data.sort_values('date')
 
     def load_gym_data(self, csv_path):
         if csv_path.exists():
             self.gym_data = pd.read_csv(csv_path)
-            self.gym_data['date'] = pd.to_datetime(self.gym_data['date'])
+            self.gym_data['date'] = pd.to_datetime(
+                self.gym_data['date'], format='ISO8601', cache=True
+            )
             self.gym_data = self.gym_data.sort_values('date')
 
     def load_routine_data(self, csv_path):
@@ -78,184 +193,249 @@ class HevyDataLoader:
             # Strip whitespace from column names
             self.routines_data.columns = self.routines_data.columns.str.strip()
             
-            self.routines_data['date'] = pd.to_datetime(self.routines_data['date'])
+            self.routines_data['date'] = pd.to_datetime(
+                self.routines_data['date'], format='ISO8601', cache=True
+            )
             self.routines_data = self.routines_data.sort_values('date')
 
     def get_bodyweight_for_date(self, workout_date):
         """Get bodyweight for a given workout date (uses most recent available)"""
-        if self.bodyweight_data is None:
+        if self.bodyweight_data is None or self.bodyweight_data.empty:
             return 70.0  # Default bodyweight
-        
-        valid_entries = self.bodyweight_data[self.bodyweight_data['date'] <= workout_date]
-        if valid_entries.empty:
-            return self.bodyweight_data.iloc[0]['weight_kg'] if not self.bodyweight_data.empty else 70.0
-        
-        return valid_entries.iloc[-1]['weight_kg']
+
+        # Binary search on the cached sorted array: O(log N) per call,
+        # no dataframe masking. Dates before the first entry fall back
+        # to the earliest weigh-in.
+        i = np.searchsorted(self._bw_dates, np.datetime64(workout_date), side='right') - 1
+        return self._bw_weights[max(i, 0)]
+
+    def _asof_lookup(self, table, value_col):
+        """As-of join a (date, value) table onto workout start_time.
+
+        Returns a Series aligned with workout_data holding, per row, the
+        value of the latest table entry with date <= start_time (NaN when
+        the workout predates the first entry). The table must be sorted.
+        """
+        left = self.workout_data[['start_time']].copy()
+        left['start_ts'] = left['start_time'].astype('datetime64[ns]')
+        left_sorted = left.sort_values('start_ts')
+        merged = pd.merge_asof(
+            left_sorted, table,
+            left_on='start_ts', right_on='date', direction='backward'
+        )
+        merged.index = left_sorted.index
+        return merged[value_col].reindex(self.workout_data.index)
 
     def process_data(self):
         """Clean and calculate derived metrics like Volume."""
         if self.workout_data is None:
             return
 
-        # 1. Filter excluded exercises
+        # 1./2. Filter excluded exercises and warmup sets in one pass:
+        # a single combined mask means one copy instead of two. The
+        # exclusion test runs on category codes — one isin over the (small)
+        # category list, then a numpy gather — instead of hashing every row.
+        keep = np.ones(len(self.workout_data), dtype=bool)
         if self.excluded_exercises:
-            self.workout_data = self.workout_data[
-                ~self.workout_data['exercise_title'].isin(self.excluded_exercises)
-            ].copy()
-
-        # 2. Filter warmup sets
+            titles = self.workout_data['exercise_title']
+            excluded_by_code = titles.cat.categories.isin(self.excluded_exercises)
+            keep &= ~excluded_by_code[titles.cat.codes.to_numpy()]
         if 'set_type' in self.workout_data.columns:
-            self.workout_data = self.workout_data[
-                self.workout_data['set_type'] != 'warmup'
-            ].copy()
+            keep &= (self.workout_data['set_type'] != 'warmup').to_numpy()
+        if not keep.all():
+            self.workout_data = self.workout_data.loc[keep].copy()
 
-        # 3. Enrich with Exercise Database Metadata
-        def get_meta(exercise, field, default):
-            return self.exercise_database.get(exercise, {}).get(field, default)
+        # 3. Enrich with Exercise Database Metadata: a single left-merge on
+        # the prebuilt metadata frame attaches all three columns at once
+        if self.exercise_meta_df is not None:
+            self.workout_data = self.workout_data.merge(
+                self.exercise_meta_df, on='exercise_title', how='left'
+            )
+        else:
+            self.workout_data[['muscle_group', 'weight_type', 'gym_dependent']] = np.nan
 
-        self.workout_data['muscle_group'] = self.workout_data['exercise_title'].apply(
-            lambda x: get_meta(x, 'muscle_group', 'unknown')
+        muscle = self.workout_data['muscle_group'].fillna('unknown')
+        # Ordered categorical: categories follow MUSCLE_GROUP_ORDER (specific
+        # muscles rank by their major group), so sorted groupby/plot output
+        # comes out in display order for free, on integer codes
+        rank = {g: i for i, g in enumerate(MUSCLE_GROUP_ORDER)}
+        cats = sorted(
+            muscle.unique(),
+            key=lambda m: (rank.get(GROUP_MAPPING.get(m, m), len(rank)), m)
         )
-        self.workout_data['weight_type'] = self.workout_data['exercise_title'].apply(
-            lambda x: get_meta(x, 'weight_type', 'unknown')
+        self.workout_data['muscle_group'] = muscle.astype(
+            pd.CategoricalDtype(categories=cats, ordered=True)
         )
-        self.workout_data['gym_dependent'] = self.workout_data['exercise_title'].apply(
-            lambda x: get_meta(x, 'gym_dependent', False)
+        self.workout_data['weight_type'] = (
+            self.workout_data['weight_type'].fillna('unknown').astype('category')
+        )
+        self.workout_data['gym_dependent'] = (
+            self.workout_data['gym_dependent'].fillna(False).astype(bool)
         )
 
-        # Gym Mapping
+        # Gym Mapping: as-of join against the gym change log (latest entry
+        # with date <= start_time), instead of re-filtering the log per row
         if self.gym_data is not None and not self.gym_data.empty:
             # Sort for safety though loading sorts it
             self.gym_data = self.gym_data.sort_values('date')
-            
-            def get_gym(dt):
-                # dt is the workout timestamp
-                # We find the latest gym entry where date <= dt
-                candidates = self.gym_data[self.gym_data['date'] <= dt]
-                if candidates.empty:
-                    return 'Unknown'
-                return candidates.iloc[-1]['gym']
-            
-            self.workout_data['gym'] = self.workout_data['start_time'].apply(get_gym)
+            gym_table = self.gym_data[['date', 'gym']].copy()
+            gym_table['date'] = gym_table['date'].astype('datetime64[ns]')
+            self.workout_data['gym'] = self._asof_lookup(gym_table, 'gym').fillna('Unknown')
         else:
             self.workout_data['gym'] = 'Unknown'
 
-        # Routine Mapping (similar logic to Gym Mapping)
+        # Routine Mapping (similar logic to Gym Mapping): build the display
+        # string once per routine row, then as-of join it onto the workouts
         if self.routines_data is not None and not self.routines_data.empty:
             self.routines_data = self.routines_data.sort_values('date')
-            
-            def get_routine_info(dt):
-                # dt is the workout timestamp
-                candidates = self.routines_data[self.routines_data['date'] <= dt]
-                if candidates.empty:
-                    # Before first routine or no routine data
-                    return None
-                
-                # Get the last matching routine (current one)
-                current_routine = candidates.iloc[-1]
-                
-                # Determine display label
-                label = current_routine['routine_label'] if pd.notna(current_routine.get('routine_label')) and str(current_routine.get('routine_label')).strip() != '' else str(current_routine['routine_id'])
-                
-                return {
-                    'routine_id': current_routine['routine_id'],
-                    'routine_label': current_routine.get('routine_label'), # Keep raw label too
-                    'display_label': label,
-                    'start_date': current_routine['date']
-                }
-
-            # We can't easily vectorise returning a dict, so we might need a couple of applies or just one that returns the ID/Label, 
-            # but we need the date range for the UI filter.
-            # Let's assign the routine_id mainly, and we can look up details later or put them in columns.
-            
-            # Actually, let's just create a 'routine_display' column for easy filtering
-            # But the user wants the filter to show the date range too.
-            # So best is to have a column 'routine_key' that links to the routine entry, or just put the full string.
-            
-            # Let's iterate to build a list of results to assign
-            routine_displays_list = []
-            
-            # Pre-calculate routine display strings to avoid doing it per row if possible, 
-            # but mapping per row is easier logic.
-            
-            # Optimisation: `searchsorted` style lookup
-            # But let's stick to apply for simplicity given dataset size is small.
-            
-            def get_fmt_routine(dt):
-                cand = self.routines_data[self.routines_data['date'] <= dt]
-                if cand.empty:
-                    return "Unknown"
-                
-                curr = cand.iloc[-1]
-                
-                # Find end date (next routine start date)
-                next_routines = self.routines_data[self.routines_data['date'] > curr['date']]
-                if next_routines.empty:
-                    end_date = "Present"
-                else:
-                    # End date is day before next routine? Or just next routine date? 
-                    # Usually "Until X"
-                    end_str = next_routines.iloc[0]['date'].strftime('%Y-%m-%d')
-                    end_date = end_str
-                
-                start_str = curr['date'].strftime('%Y-%m-%d')
-                
-                label = curr['routine_label'] if pd.notna(curr.get('routine_label')) and str(curr.get('routine_label')).strip() != '' else str(curr['routine_id'])
-                
-                return f"{label} ({start_str} - {end_date})"
-
-            self.workout_data['routine_name'] = self.workout_data['start_time'].apply(get_fmt_routine)
+            routines = self.routines_data
+
+            # Display label: routine_label when present, else the routine_id
+            labels = routines.get('routine_label')
+            if labels is not None:
+                use_label = labels.notna() & (labels.astype(str).str.strip() != '')
+                label = labels.astype(str).where(use_label, routines['routine_id'].astype(str))
+            else:
+                label = routines['routine_id'].astype(str)
 
+            # Date range: from this routine's start to the next one's start
+            start_str = routines['date'].dt.strftime('%Y-%m-%d')
+            end_str = routines['date'].shift(-1).dt.strftime('%Y-%m-%d').fillna('Present')
+
+            routine_table = pd.DataFrame({
+                'date': routines['date'].astype('datetime64[ns]'),
+                'routine_display': label + ' (' + start_str + ' - ' + end_str + ')',
+            })
+            self.workout_data['routine_name'] = (
+                self._asof_lookup(routine_table, 'routine_display').fillna('Unknown')
+            )
         else:
             self.workout_data['routine_name'] = 'Unknown'
 
 
-        # 4. Volume Calculation
-        self.workout_data['workout_date'] = self.workout_data['start_time'].dt.date
-        self.workout_data['volume'] = 0.0
+        # 4. Volume Calculation — staged in one float32 array and written
+        # to the frame once, instead of per-mask .loc assignments
+        # datetime64 normalized to midnight (not Python date objects):
+        # comparisons stay in int64 space with no per-row boxing
+        self.workout_data['workout_date'] = self.workout_data['start_time'].dt.normalize()
 
         # Create masks for different calculation types
-        double_weight_mask = self.workout_data['weight_type'] == 'double_weight'
-        assisted_mask = self.workout_data['weight_type'] == 'assisted'
-        bodyweight_mask = self.workout_data['weight_type'] == 'bodyweight'
-        weighted_bodyweight_mask = self.workout_data['weight_type'] == 'weighted_bodyweight'
-        
+        double_weight_mask = (self.workout_data['weight_type'] == 'double_weight').to_numpy()
+        assisted_mask = (self.workout_data['weight_type'] == 'assisted').to_numpy()
+        bodyweight_mask = (self.workout_data['weight_type'] == 'bodyweight').to_numpy()
+        weighted_bodyweight_mask = (self.workout_data['weight_type'] == 'weighted_bodyweight').to_numpy()
+
         # Standard: Anything NOT special. (weighted, unknown, etc.)
-        standard_mask = (~double_weight_mask) & (~assisted_mask) & (~bodyweight_mask) & (~weighted_bodyweight_mask)
+        bw_dependent_mask = assisted_mask | bodyweight_mask | weighted_bodyweight_mask
+        standard_mask = ~double_weight_mask & ~bw_dependent_mask
+
+        weight = self.workout_data['weight_kg'].fillna(0).to_numpy()
+        reps = self.workout_data['reps'].fillna(0).to_numpy()
+        vols = np.zeros(len(self.workout_data), dtype=np.float32)
 
         # A. Standard: Weight * Reps
-        self.workout_data.loc[standard_mask, 'volume'] = (
-            self.workout_data.loc[standard_mask, 'weight_kg'].fillna(0) * 
-            self.workout_data.loc[standard_mask, 'reps']
-        )
+        vols[standard_mask] = weight[standard_mask] * reps[standard_mask]
 
         # B. Double Weight (Dumbbells): Weight * 2 * Reps
-        self.workout_data.loc[double_weight_mask, 'volume'] = (
-            self.workout_data.loc[double_weight_mask, 'weight_kg'].fillna(0) * 2 * 
-            self.workout_data.loc[double_weight_mask, 'reps']
+        vols[double_weight_mask] = weight[double_weight_mask] * 2 * reps[double_weight_mask]
+
+        # C. Bodyweight dependent types (Assisted, Bodyweight, Weighted Bodyweight)
+        # One merge_asof attaches the latest bodyweight per row, then
+        # np.select picks the formula — no Python-level iteration.
+        if bw_dependent_mask.any():
+            positions = np.flatnonzero(bw_dependent_mask)
+            sub = self.workout_data.iloc[positions][
+                ['workout_date', 'weight_type']
+            ].copy()
+            sub['position'] = positions
+            sub['workout_ts'] = sub['workout_date'].astype('datetime64[ns]')
+            sub = sub.sort_values('workout_ts')
+
+            if self.bodyweight_data is not None and not self.bodyweight_data.empty:
+                bw_table = (
+                    self.bodyweight_data.sort_values('date')[['date', 'weight_kg']]
+                    .rename(columns={'weight_kg': 'bw'})
+                )
+                bw_table['date'] = bw_table['date'].astype('datetime64[ns]')
+                merged = pd.merge_asof(
+                    sub, bw_table,
+                    left_on='workout_ts', right_on='date', direction='backward'
+                )
+                # Workouts before the first weigh-in fall back to the earliest entry
+                sub['bw'] = merged['bw'].fillna(bw_table['bw'].iloc[0]).values
+            else:
+                sub['bw'] = 70.0  # Default bodyweight
+
+            # Reuse the NaN-filled arrays from above instead of re-running
+            # fillna on the sub-frame
+            bw = sub['bw'].values
+            sorted_pos = sub['position'].values
+            sub_weight = weight[sorted_pos]
+            sub_reps = reps[sorted_pos]
+            w_type = sub['weight_type'].values
+
+            # Per-mask slices instead of np.select: each formula only
+            # touches its own rows, no full-length temporaries
+            m = w_type == 'assisted'
+            vols[sorted_pos[m]] = (bw[m] - sub_weight[m]) * sub_reps[m]
+            m = w_type == 'bodyweight'
+            vols[sorted_pos[m]] = bw[m] * sub_reps[m]
+            m = w_type == 'weighted_bodyweight'
+            vols[sorted_pos[m]] = (bw[m] + sub_weight[m]) * sub_reps[m]
+
+        # Single contiguous column write; float32/int32 are also what
+        # plotly's typed-array (base64) transport wants
+        self.workout_data['volume'] = vols
+        self.workout_data['reps'] = self.workout_data['reps'].fillna(0).astype('int32')
+
+        # 5. Keep the frame sorted by time so date/year filters can binary
+        # search and slice instead of scanning a boolean mask.
+        self.workout_data = (
+            self.workout_data.sort_values('start_time', kind='stable').reset_index(drop=True)
         )
 
-        # C. Iterative calculations for Bodyweight dependent types
-        # (Assisted, Bodyweight, Weighted Bodyweight)
-        if assisted_mask.any() or bodyweight_mask.any() or weighted_bodyweight_mask.any():
-            
-            # Combine masks to iterate efficiently
-            bw_dependent_mask = assisted_mask | bodyweight_mask | weighted_bodyweight_mask
-            
-            for idx, row in self.workout_data[bw_dependent_mask].iterrows():
-                bw = self.get_bodyweight_for_date(pd.Timestamp(row['workout_date']))
-                weight = row['weight_kg'] if pd.notna(row['weight_kg']) else 0.0
-                reps = row['reps'] if pd.notna(row['reps']) else 0
-                w_type = row['weight_type']
-                
-                vol = 0.0
-                if w_type == 'assisted':
-                    vol = (bw - weight) * reps
-                elif w_type == 'bodyweight':
-                    vol = bw * reps
-                elif w_type == 'weighted_bodyweight':
-                    vol = (bw + weight) * reps
-                
-                self.workout_data.loc[idx, 'volume'] = vol
-        
-        self.workout_data['volume'] = self.workout_data['volume'].fillna(0)
+        # 6. Categoricals: these columns are grouped, filtered and compared on
+        # every rerun; integer codes make those ops much cheaper and shrink
+        # the columns to a fraction of their object-dtype size.
+        for col in ('routine_name', 'exercise_title', 'muscle_group', 'weight_type', 'gym'):
+            self.workout_data[col] = self.workout_data[col].astype('category')
+
+        # 7. Precompute time-derived columns once so the app never touches the
+        # datetime accessor on a rerun (plain int compares are far cheaper).
+        self.workout_data['year'] = self.workout_data['start_time'].dt.year.astype('int16')
+        # Day bucket as datetime64 (no Python date objects): nunique/unique
+        # run on int64 values instead of hashing per-row objects
+        self.workout_data['day'] = self.workout_data['start_time'].values.astype('datetime64[D]')
+        iso = self.workout_data['start_time'].dt.isocalendar()
+        self.workout_data['iso_year'] = iso.year.astype('int16')
+        self.workout_data['iso_week'] = iso.week.astype('int8')
+        self.workout_data['duration_s'] = (
+            self.workout_data['end_time'] - self.workout_data['start_time']
+        ).dt.total_seconds()
+
+        self._build_summary_tables()
+
+    def _build_summary_tables(self):
+        """Derive the per-workout table and sidebar option lists.
+
+        Split out of process_data so the Parquet cache path can rebuild
+        them without re-running the full pipeline.
+        """
+        # 8. Compact per-workout table (one row per session). KPI queries on
+        # durations/counts scan this instead of the full per-set frame.
+        self.workouts = (
+            self.workout_data
+            .drop_duplicates('start_time')
+            [['start_time', 'end_time', 'routine_name', 'year', 'day', 'duration_s']]
+            .reset_index(drop=True)
+        )
+
+        # 9. Sidebar option lists: fixed per dataset, so compute them here
+        # instead of on every rerun. Routines sorted by most recent first.
+        self.available_years = sorted(self.workouts['year'].unique().tolist(), reverse=True)
+        # workouts is time-sorted, so each routine's first row is its start:
+        # dedup + sort replaces a hashed groupby-min over the whole table
+        first_seen = self.workouts.drop_duplicates('routine_name', keep='first')
+        self.routine_order = (
+            first_seen.sort_values('start_time', ascending=False)['routine_name'].tolist()
+        )
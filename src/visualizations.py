@@ -1,125 +1,341 @@
-import plotly.express as px
+import functools
+
 import plotly.graph_objects as go
+import plotly.io as pio
+import numpy as np
 import pandas as pd
 from .const import MUSCLE_GROUP_COLORS, PHASE_COLORS, GROUP_MAPPING, MUSCLE_GROUP_ORDER
 
+# orjson serializes the chart payloads several times faster than the
+# stdlib encoder and handles numpy arrays without a tolist() round-trip.
+# Configured where the figures are built so every entry point gets it.
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+# Built once at import: the charts reuse these instead of rebuilding the
+# display-name color map per call
+DISPLAY_COLOR_MAP = {k.replace('_', ' ').title(): v for k, v in MUSCLE_GROUP_COLORS.items()}
+DISPLAY_GROUP_ORDER = [g.replace('_', ' ').title() for g in MUSCLE_GROUP_ORDER]
+
+# Shared layout fragments, built once; update_layout copies values into
+# the figure, so reusing these by reference is safe
+_LEGEND_TOP = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+_YAXIS2_BODYWEIGHT = dict(title='Bodyweight (kg)', overlaying='y', side='right', showgrid=False)
+
+# Consistency-heatmap constants (row order matches the matrix layout)
+_DAY_NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+_HEATMAP_HOVER = '<b>%{y}</b>, %{x}<br>Sets: %{z:.0f}<extra></extra>'
+
+def _memoize_figure(method):
+    """Cache a chart method's figure per argument tuple.
+
+    The visualizer's frames are treated as immutable, so a figure is fully
+    determined by the method and its (hashable) arguments; repeat calls on
+    control toggles skip both the pandas work and figure construction.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in self._fig_cache:
+            self._fig_cache[key] = method(self, *args, **kwargs)
+        return self._fig_cache[key]
+    return wrapper
+
+# Traces denser than this get downsampled before shipping to the browser
+MAX_TRACE_POINTS = 2000
+
+def _lttb_downsample(x, y, n_out=1000):
+    """Largest-Triangle-Three-Buckets downsampling to n_out points.
+
+    Picks, per bucket, the point forming the largest triangle with its
+    neighbours, which preserves the visual shape of a dense series far
+    better than striding. Returns the inputs unchanged when small enough.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    xf = x.astype('int64') if x.dtype.kind == 'M' else np.asarray(x, dtype='float64')
+    yf = np.asarray(y, dtype='float64')
+
+    # Bucket edges: first and last points are always kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype('int64')
+    keep = np.empty(n_out, dtype='int64')
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if hi <= lo:
+            keep[i + 1] = lo
+            continue
+        # Anchor: previously kept point; target: next bucket's mean
+        ax, ay = xf[keep[i]], yf[keep[i]]
+        nlo, nhi = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        bx, by = xf[nlo:nhi].mean(), yf[nlo:nhi].mean()
+        areas = np.abs(
+            (ax - bx) * (yf[lo:hi] - ay) - (ax - xf[lo:hi]) * (by - ay)
+        )
+        keep[i + 1] = lo + int(areas.argmax())
+
+    return x[keep], y[keep]
+
+@functools.lru_cache(maxsize=None)
+def _fill_rgba(color, alpha=0.1):
+    """Translucent fill variant of a trace color (rgba/rgb/hex input).
+
+    Cached: the same few palette colors repeat across radar renders, so
+    each string is parsed once per process.
+    """
+    c = color.strip()
+    if c.startswith('rgba'):
+        # e.g. rgba(54, 162, 235, 0.6) -> replace the alpha component
+        parts = c.rsplit(',', 1)
+        return f'{parts[0]}, {alpha})' if len(parts) == 2 else c
+    if c.startswith('rgb'):
+        return c.replace('rgb', 'rgba').replace(')', f', {alpha})')
+    if c.startswith('#'):
+        h = c[1:]
+        if len(h) == 3:
+            h = ''.join(ch * 2 for ch in h)
+        if len(h) >= 6:
+            try:
+                r, g, b = int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
+            except ValueError:
+                return c
+            return f'rgba({r}, {g}, {b}, {alpha})'
+    # Named colors etc.: leave as-is (opaque)
+    return c
+
+def map_major_group(muscle_series):
+    """Map specific muscles to their major group, keeping unmapped values.
+
+    On categorical input the mapping runs over the (tiny) category list
+    and a single int8 lookup-table gather over the row codes — no per-row
+    dict lookups. Object dtype falls back to a hashtable map.
+    """
+    if isinstance(muscle_series.dtype, pd.CategoricalDtype):
+        cats = muscle_series.cat.categories
+        mapped = [GROUP_MAPPING.get(c, c) for c in cats]
+        target = list(dict.fromkeys(mapped))
+        lut = np.array([target.index(m) for m in mapped], dtype=np.int8)
+        codes = lut[muscle_series.cat.codes.to_numpy()]
+        return pd.Series(
+            pd.Categorical.from_codes(codes, target), index=muscle_series.index
+        )
+    values = muscle_series.astype('object')
+    return values.map(GROUP_MAPPING).fillna(values)
+
 class WorkoutVisualizer:
     def __init__(self, df, bodyweight_df=None, phase_df=None):
-        self.df = df
+        # Columns every chart needs, computed once instead of per call:
+        # the major-group mapping and the month bucket. assign leaves the
+        # caller's frame untouched (shallow copy plus the two new columns).
+        self.df = df.assign(
+            major_group=map_major_group(df['muscle_group']).astype('category'),
+            month_date=df['start_time'].values.astype('datetime64[M]'),
+        )
+        if bodyweight_df is not None and not bodyweight_df.empty:
+            # float32 halves the bytes moved by the overlay aggregations
+            bodyweight_df = (
+                bodyweight_df.sort_values('date').reset_index(drop=True)
+                .assign(weight_kg=bodyweight_df['weight_kg'].astype('float32'))
+            )
         self.bodyweight_df = bodyweight_df
         self.phases_data = phase_df
+        self._fig_cache = {}
+
+        # Monthly bodyweight averages with phase labels, aggregated once
+        # for the whole history; the overlay slices this table per chart
+        if bodyweight_df is not None and not bodyweight_df.empty:
+            self._bw_monthly = self._build_monthly_bodyweight()
+        else:
+            self._bw_monthly = None
+
+        # Year slices resolved once: charts grab a prebuilt view instead
+        # of copying the whole frame and re-deriving dt.year per call
+        self._by_year = {
+            int(y): g for y, g in self.df.groupby(self.df['start_time'].dt.year, sort=False)
+        }
+
+        # (min, max) start_time per year filter, resolved once; the frame
+        # is already time-sorted so each group's edge rows are its bounds
+        self._year_bounds = {
+            y: (g['start_time'].iloc[0], g['start_time'].iloc[-1])
+            for y, g in self._by_year.items()
+        }
+        if len(self.df):
+            self._year_bounds[None] = (
+                self.df['start_time'].iloc[0], self.df['start_time'].iloc[-1]
+            )
+
+        # Lazy per-exercise index: the progression chart fetches one
+        # group in O(group size) instead of scanning the whole frame
+        self._by_exercise = self.df.groupby('exercise_title', sort=False, observed=True)
+
+        # Full-history monthly totals, aggregated once; year filters slice
+        # this table (O(months)) instead of re-aggregating row-level data
+        self._monthly_major = (
+            self.df.groupby(['month_date', 'major_group'], as_index=False, sort=False, observed=True)
+            ['volume'].sum()
+        )
+        # Tonnes scale computed once, not in every chart call
+        self._monthly_major['volume_k'] = self._monthly_major['volume'] / 1000.0
+
+    def _year_slice(self, year):
+        """View of the frame for one year; the full frame when year is falsy."""
+        if not year:
+            return self.df
+        return self._by_year.get(int(year), self.df.iloc[0:0])
+
+    def _build_monthly_bodyweight(self):
+        """Aggregate the full bodyweight history into a monthly phase table."""
+        bw_data = self.bodyweight_df
+
+        # Very dense histories (several entries per day over years) get
+        # LTTB-thinned first; the monthly mean afterwards barely moves
+        if len(bw_data) > MAX_TRACE_POINTS:
+            dates, weights = _lttb_downsample(
+                bw_data['date'].to_numpy(), bw_data['weight_kg'].to_numpy()
+            )
+            bw_data = pd.DataFrame({'date': dates, 'weight_kg': weights})
 
+        # Month truncation as a plain datetime64 cast (no Period objects)
+        bw_data = bw_data.assign(
+            month_date=bw_data['date'].to_numpy().astype('datetime64[M]').astype('datetime64[ns]')
+        )
+        monthly_bw = bw_data.groupby('month_date', as_index=False)['weight_kg'].mean()
+
+        # Phase Lookup: one backward as-of join against the sorted
+        # phase history tags every month at once
+        if self.phases_data is not None and not self.phases_data.empty:
+            phase_table = pd.DataFrame({
+                'phase_date': self.phases_data['date'].astype('datetime64[ns]'),
+                'phase': self.phases_data['phase'],
+            })
+            monthly_bw = pd.merge_asof(
+                monthly_bw, phase_table,
+                left_on='month_date', right_on='phase_date', direction='backward',
+            ).drop(columns='phase_date')
+            monthly_bw['phase'] = monthly_bw['phase'].fillna('unknown')
+        else:
+            monthly_bw['phase'] = 'unknown'
+        return monthly_bw
+
+    def _date_bounds(self, year):
+        """Precomputed (min, max) start_time for a year filter."""
+        return self._year_bounds[int(year) if year else None]
+
+    def _monthly_bodyweight(self, min_date, max_date):
+        """View of the precomputed monthly bodyweight table for a date range."""
+        months = self._bw_monthly['month_date'].to_numpy()
+        lo_month = pd.Timestamp(min_date).to_datetime64().astype('datetime64[M]').astype('datetime64[ns]')
+        lo = np.searchsorted(months, lo_month, side='left')
+        hi = np.searchsorted(months, pd.Timestamp(max_date).to_datetime64(), side='right')
+        return self._bw_monthly.iloc[lo:hi]
+
+    def _add_bodyweight_overlay(self, fig, min_date, max_date):
+        """Add the shared bodyweight overlay (faint line + phase markers)."""
+        if self.bodyweight_df is None or self.bodyweight_df.empty:
+            return
+
+        monthly_bw = self._monthly_bodyweight(min_date, max_date)
+        if monthly_bw.empty:
+            return
+
+        # Phase markers ride on one trace with a per-point color array —
+        # validation, serialization and client render cost scale with trace
+        # count, not point count. The phase shows in the hover via
+        # customdata. Both traces go in with a single add_traces call.
+        phases = monthly_bw['phase']
+        colors = phases.map(lambda p: PHASE_COLORS.get(p, '#ffffff')).to_numpy()
+        fig.add_traces([
+            # 1. Background connection line (neutral)
+            go.Scattergl(
+                x=monthly_bw['month_date'],
+                y=monthly_bw['weight_kg'],
+                mode='lines',
+                line=dict(color='rgba(255,255,255,0.4)', width=3),
+                showlegend=False,
+                hoverinfo='skip',
+                yaxis='y2'
+            ),
+            # 2. Phase Markers
+            go.Scattergl(
+                x=monthly_bw['month_date'],
+                y=monthly_bw['weight_kg'],
+                name='Bodyweight',
+                mode='markers',
+                marker=dict(color=colors, size=8, line=dict(width=1, color='white')),
+                yaxis='y2',
+                customdata=phases.to_numpy(),
+                hovertemplate='%{y:.1f} kg (%{customdata})'
+            ),
+        ])
+
+        # Configure Secondary Y-Axis
+        fig.update_layout(yaxis2=_YAXIS2_BODYWEIGHT)
+
+    @_memoize_figure
     def create_monthly_volume_chart(self, year=None):
         """
         Creates a stacked bar chart of monthly volume by muscle group.
         Includes a secondary line for monthly average bodyweight.
         """
-        plot_data = self.df.copy()
-        if year:
-            plot_data = plot_data[plot_data['start_time'].dt.year == year]
+        plot_data = self._year_slice(year)
 
         if plot_data.empty:
             return None
 
         # --- 1. Volume Data Preparation ---
-        # Align dates to start of month for consistent grouping
-        plot_data['month_date'] = plot_data['start_time'].dt.to_period('M').dt.start_time
-        plot_data['major_group'] = plot_data['muscle_group'].replace(GROUP_MAPPING)
-        
-        # Aggregate Volume
-        monthly_vol = plot_data.groupby(['month_date', 'major_group'])['volume'].sum().reset_index()
-        monthly_vol['volume_k'] = monthly_vol['volume'] / 1000.0
+        # Slice the prebuilt full-history monthly table instead of
+        # re-aggregating the row-level frame
+        monthly_vol = self._monthly_major
+        if year:
+            monthly_vol = monthly_vol[monthly_vol['month_date'].dt.year == int(year)]
 
         # [MODIFIED] Create Display Column for cleaner legend
-        # We need a new color map for the formatted names
-        monthly_vol['display_group'] = monthly_vol['major_group'].apply(lambda x: x.replace('_', ' ').title())
+        # We need a new color map for the formatted names.
+        # assign (instead of copy + column write) only materializes the new
+        # column; .map on a categorical runs the formatter per category.
+        monthly_vol = monthly_vol.assign(
+            display_group=monthly_vol['major_group'].map(lambda x: x.replace('_', ' ').title())
+        )
         
-        display_color_map = {k.replace('_', ' ').title(): v for k, v in MUSCLE_GROUP_COLORS.items()}
-        display_orders = [g.replace('_', ' ').title() for g in MUSCLE_GROUP_ORDER]
 
         # --- 2. Create Stacked Bar Chart ---
-        fig = px.bar(
-            monthly_vol,
-            x='month_date',
-            y='volume_k',
-            color='display_group',
-            title='Monthly Training Volume (tonnes) & Bodyweight (kg)',
-            color_discrete_map=display_color_map,
-            category_orders={'display_group': display_orders},
-            text='volume_k',
-            labels={'volume_k': 'Volume', 'display_group': 'Group', 'month_date': 'Date'}
-        )
-
-        fig.update_traces(
-            texttemplate='%{text:.1f}', 
-            textposition='inside', 
-            textfont_size=16,
-            hovertemplate='%{y:.1f} t'
+        # go.Bar per group straight from numpy arrays: skips px's internal
+        # DataFrame re-partitioning, trace order fixes the stack order
+        # One go.Figure(data=...) call validates the trace list in a single
+        # pass instead of once per add_trace
+        seen = set(monthly_vol['display_group'])
+        ordered = [g for g in DISPLAY_GROUP_ORDER if g in seen]
+        ordered += [g for g in seen if g not in DISPLAY_GROUP_ORDER]
+        bars = []
+        for display in ordered:
+            sub = monthly_vol[monthly_vol['display_group'] == display]
+            bars.append(go.Bar(
+                x=sub['month_date'].to_numpy(),
+                y=sub['volume_k'].to_numpy(),
+                name=display,
+                marker_color=DISPLAY_COLOR_MAP.get(display, '#ffffff'),
+                text=sub['volume_k'].to_numpy(),
+                texttemplate='%{text:.1f}',
+                textposition='inside',
+                textfont=dict(size=16),
+                hovertemplate='%{y:.1f} t'
+            ))
+        fig = go.Figure(data=bars)
+        fig.update_layout(
+            barmode='stack',
+            title='Monthly Training Volume (tonnes) & Bodyweight (kg)'
         )
 
         # --- 3. Bodyweight Overlay (Monthly Average) ---
-        if self.bodyweight_df is not None and not self.bodyweight_df.empty:
-            # Filter bodyweight data to relevant range
-            min_date = plot_data['start_time'].min()
-            max_date = plot_data['start_time'].max()
-            
-            bw_data = self.bodyweight_df[
-                (self.bodyweight_df['date'] >= min_date) & 
-                (self.bodyweight_df['date'] <= max_date)
-            ].copy()
-
-            if not bw_data.empty:
-                # Calculate Monthly Average
-                bw_data['month_date'] = bw_data['date'].dt.to_period('M').dt.start_time
-                monthly_bw = bw_data.groupby('month_date')['weight_kg'].mean().reset_index()
-                
-                # Phase Lookup
-                def get_phase(dt):
-                    if self.phases_data is not None:
-                        past_phases = self.phases_data[self.phases_data['date'] <= dt]
-                        if not past_phases.empty: return past_phases.iloc[-1]['phase']
-                    return 'unknown'
-
-                monthly_bw['phase'] = monthly_bw['month_date'].apply(get_phase)
-
-                # 1. Background line
-                fig.add_trace(
-                    go.Scatter(
-                        x=monthly_bw['month_date'],
-                        y=monthly_bw['weight_kg'],
-                        mode='lines',
-                        line=dict(color='rgba(255,255,255,0.4)', width=3),
-                        showlegend=False,
-                        hoverinfo='skip',
-                        yaxis='y2'
-                    )
-                )
-
-                # 2. Phase Markers
-                for phase_name in monthly_bw['phase'].unique():
-                    phase_subset = monthly_bw[monthly_bw['phase'] == phase_name]
-                    color = PHASE_COLORS.get(phase_name, '#ffffff')
-                    fig.add_trace(
-                        go.Scatter(
-                            x=phase_subset['month_date'],
-                            y=phase_subset['weight_kg'],
-                            name=f"BW ({phase_name})",
-                            mode='markers',
-                            marker=dict(color=color, size=8, line=dict(width=1, color='white')),
-                            yaxis='y2',
-                            hovertemplate='%{y:.1f} kg'
-                        )
-                    )
-
-                # Configure Secondary Y-Axis
-                fig.update_layout(
-                    yaxis2=dict(
-                        title='Bodyweight (kg)',
-                        overlaying='y',
-                        side='right',
-                        showgrid=False
-                    )
-                )
+        self._add_bodyweight_overlay(fig, *self._date_bounds(year))
 
         # --- 4. Final Layout Polish ---
         tick_format = "%b" if year else "%b %Y"
@@ -135,17 +351,15 @@ class WorkoutVisualizer:
             yaxis_title='Volume (x1000 kg)',
             legend_title_text='Muscle Group',
             hovermode='x unified',
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
+            legend=_LEGEND_TOP,
+            # Keep the existing scene/zoom on data-only updates, no animation
+            uirevision='keep',
+            transition_duration=0
         )
 
         return fig
 
+    @_memoize_figure
     def create_monthly_specific_muscle_chart(self, year=None, filter_group=None):
         """
         Creates a stacked bar chart of monthly volume by SPECIFIC muscle group.
@@ -155,101 +369,54 @@ class WorkoutVisualizer:
             year (int): Filter by year
             filter_group (str): If provided (e.g. 'arms'), only show muscles in this major group.
         """
-        plot_data = self.df.copy()
-        if year:
-            plot_data = plot_data[plot_data['start_time'].dt.year == year]
-            
+        plot_data = self._year_slice(year)
+
         if filter_group:
-            # Filter specifically for muscles matching this major group
-            # We need to map each row's muscle_group to check if it belongs to filter_group
-            plot_data['mapped_group'] = plot_data['muscle_group'].replace(GROUP_MAPPING)
-            plot_data = plot_data[plot_data['mapped_group'] == filter_group]
+            # Keep only muscles belonging to this major group (precomputed)
+            plot_data = plot_data[plot_data['major_group'] == filter_group]
 
         if plot_data.empty:
             return None
 
         # --- 1. Volume Data Preparation ---
-        plot_data['month_date'] = plot_data['start_time'].dt.to_period('M').dt.start_time
-        
         # Aggregate Volume by specific 'muscle_group'
-        monthly_vol = plot_data.groupby(['month_date', 'muscle_group'])['volume'].sum().reset_index()
+        monthly_vol = (
+            plot_data.groupby(['month_date', 'muscle_group'], as_index=False, sort=False, observed=True)
+            ['volume'].sum()
+        )
         monthly_vol['volume_k'] = monthly_vol['volume'] / 1000.0
 
         # [MODIFIED] Create Display Column
-        monthly_vol['display_muscle'] = monthly_vol['muscle_group'].apply(lambda x: x.replace('_', ' ').title())
-        display_color_map = {k.replace('_', ' ').title(): v for k, v in MUSCLE_GROUP_COLORS.items()}
+        monthly_vol['display_muscle'] = monthly_vol['muscle_group'].map(lambda x: x.replace('_', ' ').title())
 
         # --- 2. Create Stacked Bar Chart ---
-        fig = px.bar(
-            monthly_vol,
-            x='month_date',
-            y='volume_k',
-            color='display_muscle',
-            title='Monthly Volume by Specific Muscle (tonnes)',
-            color_discrete_map=display_color_map,
-            text='volume_k',
-            labels={'volume_k': 'Volume', 'display_muscle': 'Muscle', 'month_date': 'Date'}
-            # We don't enforce a strict order here as there are many specific muscles,
-            # but Plotly usually sorts by value or name.
-        )
-        
-        fig.update_traces(
-            texttemplate='%{text:.1f}', 
-            textposition='inside', 
-            textfont_size=16,
-            hovertemplate='%{y:.1f} t'
+        # go.Bar per muscle straight from numpy arrays (same as the major-
+        # group chart): skips px's internal frame re-partitioning and
+        # per-cell trace validation. Appearance order matches px's default.
+        # We don't enforce a strict order here as there are many specific muscles.
+        bars = []
+        for display in dict.fromkeys(monthly_vol['display_muscle']):
+            sub = monthly_vol[monthly_vol['display_muscle'] == display]
+            bars.append(go.Bar(
+                x=sub['month_date'].to_numpy(),
+                y=sub['volume_k'].to_numpy(),
+                name=display,
+                marker_color=DISPLAY_COLOR_MAP.get(display, '#ffffff'),
+                text=sub['volume_k'].to_numpy(),
+                texttemplate='%{text:.1f}',
+                textposition='inside',
+                textfont=dict(size=16),
+                hovertemplate='%{y:.1f} t'
+            ))
+        fig = go.Figure(data=bars)
+        fig.update_layout(
+            barmode='stack',
+            title='Monthly Volume by Specific Muscle (tonnes)'
         )
-        
-        # --- 3. Bodyweight Overlay (Phase Colored) ---
-        if self.bodyweight_df is not None and not self.bodyweight_df.empty and self.phases_data is not None:
-             min_date = plot_data['start_time'].min()
-             max_date = plot_data['start_time'].max()
-             bw_data = self.bodyweight_df[
-                (self.bodyweight_df['date'] >= min_date) & 
-                (self.bodyweight_df['date'] <= max_date)
-            ].copy()
-             if not bw_data.empty:
-                bw_data['month_date'] = bw_data['date'].dt.to_period('M').dt.start_time
-                monthly_bw = bw_data.groupby('month_date')['weight_kg'].mean().reset_index()
-                
-                def get_phase(dt):
-                    past_phases = self.phases_data[self.phases_data['date'] <= dt]
-                    if not past_phases.empty: return past_phases.iloc[-1]['phase']
-                    return 'unknown'
 
-                monthly_bw['phase'] = monthly_bw['month_date'].apply(get_phase)
-                
-                fig.add_trace(go.Scatter(
-                    x=monthly_bw['month_date'],
-                    y=monthly_bw['weight_kg'],
-                    mode='lines',
-                    line=dict(color='rgba(255,255,255,0.4)', width=3),
-                    showlegend=False,
-                    yaxis='y2',
-                    hoverinfo='skip'
-                ))
-                
-                for phase_name in monthly_bw['phase'].unique():
-                    phase_subset = monthly_bw[monthly_bw['phase'] == phase_name]
-                    color = PHASE_COLORS.get(phase_name, '#ffffff')
-                    fig.add_trace(go.Scatter(
-                        x=phase_subset['month_date'],
-                        y=phase_subset['weight_kg'],
-                        name=f"BW ({phase_name})",
-                        mode='markers',
-                        marker=dict(color=color, size=8, line=dict(width=1, color='white')),
-                        yaxis='y2',
-                        hovertemplate='%{y:.1f} kg'
-                    ))
-
-                fig.update_layout(
-                    yaxis2=dict(
-                        title='Bodyweight (kg)',
-                        overlaying='y',
-                        side='right',
-                        showgrid=False
-                    )
-                )
+        # --- 3. Bodyweight Overlay (Phase Colored) ---
+        if self.phases_data is not None:
+            self._add_bodyweight_overlay(fig, *self._date_bounds(year))
 
         # --- 4. Final Layout ---
         tick_format = "%b" if year else "%b %Y"
@@ -264,35 +431,28 @@ class WorkoutVisualizer:
             yaxis_title='Volume (x1000 kg)',
             legend_title_text='Specific Muscle',
             hovermode='x unified',
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
+            legend=_LEGEND_TOP,
+            uirevision='keep',
+            transition_duration=0
         )
 
         return fig
 
+    @_memoize_figure
     def create_monthly_volume_per_workout_chart(self, year=None, filter_group=None):
         """
         Creates a stacked bar chart of monthly volume per workout (Intensity).
         (Total Volume / Number of Workouts in that month)
         """
-        plot_data = self.df.copy()
-        if year:
-            plot_data = plot_data[plot_data['start_time'].dt.year == year]
+        plot_data = self._year_slice(year)
 
         if filter_group:
-            plot_data['mapped_group'] = plot_data['muscle_group'].replace(GROUP_MAPPING)
-            plot_data = plot_data[plot_data['mapped_group'] == filter_group]
-        
+            plot_data = plot_data[plot_data['major_group'] == filter_group]
+
         if plot_data.empty:
             return None
 
         # --- 1. Data Prep ---
-        plot_data['month_date'] = plot_data['start_time'].dt.to_period('M').dt.start_time
         
         # Calculate Workouts per Month (denominator)
         # We count unique workout dates per month from the ORIGINAL filtered dataframe (before muscle grouping?)
@@ -304,123 +464,58 @@ class WorkoutVisualizer:
         # The user said "Volume divided by number of workouts". Ref1 likely did Total Volume / Total Workouts.
         # Let's count unique start_times involved in this slice.
         
-        workouts_per_month = plot_data.groupby('month_date')['start_time'].nunique().reset_index(name='workout_count')
+        workouts_per_month = plot_data.groupby('month_date')['start_time'].nunique()
         
         # Aggregate Volume
         group_col = 'muscle_group' if filter_group else 'major_group'
-        if not filter_group:
-             plot_data['major_group'] = plot_data['muscle_group'].replace(GROUP_MAPPING)
-        
-        monthly_vol = plot_data.groupby(['month_date', group_col])['volume'].sum().reset_index()
+
+        monthly_vol = (
+            plot_data.groupby(['month_date', group_col], as_index=False, sort=False, observed=True)
+            ['volume'].sum()
+        )
         
-        # Merge to get denominator
-        merged = pd.merge(monthly_vol, workouts_per_month, on='month_date')
-        merged['avg_vol_k'] = (merged['volume'] / merged['workout_count']) / 1000.0
+        # Attach the denominator with an index lookup instead of a hash join
+        merged = monthly_vol
+        # float32 count keeps the division (and the plotted column) float32
+        merged['workout_count'] = merged['month_date'].map(workouts_per_month).astype(np.float32)
+        merged['avg_vol_k'] = (merged['volume'] / merged['workout_count']) / np.float32(1000.0)
         
         # --- 2. Plot ---
         # [MODIFIED] Create Display Column
-        merged['display_group'] = merged[group_col].apply(lambda x: x.replace('_', ' ').title())
-        display_color_map = {k.replace('_', ' ').title(): v for k, v in MUSCLE_GROUP_COLORS.items()}
-        
-        orders = {}
-        if not filter_group:
-             display_orders = [g.replace('_', ' ').title() for g in MUSCLE_GROUP_ORDER]
-             orders = {'display_group': display_orders}
-
-        fig = px.bar(
-            merged,
-            x='month_date',
-            y='avg_vol_k',
-            color='display_group',
-            title='Avg Volume per Workout (tonnes) & Bodyweight (kg)',
-            color_discrete_map=display_color_map,
-            category_orders=orders,
-            text='avg_vol_k',
-            labels={'avg_vol_k': 'Average Volume', 'display_group': 'Group', 'month_date': 'Date'}
-        )
-        
-        fig.update_traces(
-            texttemplate='%{text:.1f}', 
-            textposition='inside', 
-            textfont_size=16,
-            hovertemplate='%{y:.1f} t'
+        merged['display_group'] = merged[group_col].map(lambda x: x.replace('_', ' ').title())
+
+        # Direct go.Bar traces, ordered like the major-group chart when no
+        # filter is active (appearance order otherwise)
+        seen = dict.fromkeys(merged['display_group'])
+        if filter_group:
+            ordered = list(seen)
+        else:
+            ordered = [g for g in DISPLAY_GROUP_ORDER if g in seen]
+            ordered += [g for g in seen if g not in DISPLAY_GROUP_ORDER]
+
+        bars = []
+        for display in ordered:
+            sub = merged[merged['display_group'] == display]
+            bars.append(go.Bar(
+                x=sub['month_date'].to_numpy(),
+                y=sub['avg_vol_k'].to_numpy(),
+                name=display,
+                marker_color=DISPLAY_COLOR_MAP.get(display, '#ffffff'),
+                text=sub['avg_vol_k'].to_numpy(),
+                texttemplate='%{text:.1f}',
+                textposition='inside',
+                textfont=dict(size=16),
+                hovertemplate='%{y:.1f} t'
+            ))
+        fig = go.Figure(data=bars)
+        fig.update_layout(
+            barmode='stack',
+            title='Avg Volume per Workout (tonnes) & Bodyweight (kg)'
         )
 
         # --- 3. Bodyweight Overlay (Phase Colored) ---
-        if self.bodyweight_df is not None and not self.bodyweight_df.empty and self.phases_data is not None:
-            min_date = plot_data['start_time'].min()
-            max_date = plot_data['start_time'].max()
-            bw_data = self.bodyweight_df[
-                (self.bodyweight_df['date'] >= min_date) & 
-                (self.bodyweight_df['date'] <= max_date)
-            ].copy()
-
-            if not bw_data.empty:
-                bw_data['month_date'] = bw_data['date'].dt.to_period('M').dt.start_time
-                # Group by month to get avg weight
-                monthly_bw = bw_data.groupby('month_date')['weight_kg'].mean().reset_index()
-                
-                # Assign Phase to each month
-                # Logic: Find the phase that started before or on this month
-                def get_phase(dt):
-                    # dt is Timestamp (start of month). 
-                    # We want the phase active at this time.
-                    past_phases = self.phases_data[self.phases_data['date'] <= dt]
-                    if not past_phases.empty:
-                        return past_phases.iloc[-1]['phase']
-                    # If no phase starts before, maybe take the first one? or 'unknown'
-                    return 'unknown'
-
-                monthly_bw['phase'] = monthly_bw['month_date'].apply(get_phase)
-
-                # Generate coloured traces using px.line logic
-                # We need to ensure connectivity. px.line with color breaks the line.
-                # To look good, we often plot a faint background line + colored markers/segments
-                
-                # 1. Background connection line (neutral)
-                fig.add_trace(
-                    go.Scatter(
-                        x=monthly_bw['month_date'],
-                        y=monthly_bw['weight_kg'],
-                        mode='lines',
-                        line=dict(color='rgba(255,255,255,0.4)', width=3),
-                        showlegend=False,
-                        hoverinfo='skip',
-                        yaxis='y2'
-                    )
-                )
-
-                # 2. Colored Markers + Lines (Segments)
-                # We use px to handle the grouping colors easily
-                # Warning: px.line creates gaps between different groups. The background line handles the visual flow.
-                
-                # Ensure colors are mapped
-                for phase_name in monthly_bw['phase'].unique():
-                    phase_subset = monthly_bw[monthly_bw['phase'] == phase_name]
-                    color = PHASE_COLORS.get(phase_name, '#ffffff')
-                    
-                    fig.add_trace(
-                        go.Scatter(
-                            x=phase_subset['month_date'],
-                            y=phase_subset['weight_kg'],
-                            name=f"BW ({phase_name})",
-                            mode='markers', # Just markers to avoid confusing gaps, or lines+markers?
-                            # If we use lines, it connects disjoint months of same phase (e.g. Bulk in Jan, Bulk in Dec -> Line across).
-                            # So strictly speaking, we should just use Markers for the phase indicator on top of the generic line.
-                            marker=dict(color=color, size=8, line=dict(width=1, color='white')),
-                            yaxis='y2',
-                            hovertemplate='%{y:.1f} kg'
-                        )
-                    )
-
-                fig.update_layout(
-                    yaxis2=dict(
-                        title='Bodyweight (kg)',
-                        overlaying='y',
-                        side='right',
-                        showgrid=False
-                    )
-                )
+        if self.phases_data is not None:
+            self._add_bodyweight_overlay(fig, *self._date_bounds(year))
 
         # --- 4. Layout ---
         tick_format = "%b" if year else "%b %Y"
@@ -431,11 +526,14 @@ class WorkoutVisualizer:
             yaxis_title='Avg Volume / Workout (tonnes)',
             legend_title_text='Muscle Group',
             hovermode='x unified',
-            legend=dict(orientation="h", y=1.15, x=1, xanchor="right")
+            legend=dict(orientation="h", y=1.15, x=1, xanchor="right"),
+            uirevision='keep',
+            transition_duration=0
         )
         
         return fig
 
+    @_memoize_figure
     def create_exercise_progression_chart(self, exercise_name):
         """
         Creates a progression chart for a specific exercise.
@@ -446,20 +544,23 @@ class WorkoutVisualizer:
         if not exercise_name:
             return None
             
-        ex_data = self.df[self.df['exercise_title'] == exercise_name].copy()
-        if ex_data.empty:
+        try:
+            ex_data = self._by_exercise.get_group(exercise_name)
+        except KeyError:
             return None
             
-        # Group by workout (start_time) to get session volume for this exercise
-        # Include 'gym' and 'gym_dependent' in aggregation
-        agg_dict = {'volume': 'sum'}
-        if 'gym' in ex_data.columns:
-            agg_dict['gym'] = 'first'
-        if 'gym_dependent' in ex_data.columns:
-            agg_dict['gym_dependent'] = 'first'
-            
-        session_vol = ex_data.groupby('start_time').agg(agg_dict).reset_index()
-        session_vol = session_vol.sort_values('start_time')
+        # Group by workout (start_time) to get session volume for this exercise.
+        # gym/gym_dependent are constant within a session, so instead of
+        # 'first' aggregations (a slow per-group path) a hash dedup plus an
+        # index join fetches them in one pass. The frame is time-sorted, so
+        # the grouped keys come out sorted too.
+        volumes = ex_data.groupby('start_time', sort=False)['volume'].sum()
+        meta_cols = [c for c in ('gym', 'gym_dependent') if c in ex_data.columns]
+        if meta_cols:
+            meta = ex_data.drop_duplicates('start_time').set_index('start_time')[meta_cols]
+            session_vol = volumes.to_frame().join(meta).reset_index()
+        else:
+            session_vol = volumes.reset_index()
         
         # Calculate Cumulative Max (Records)
         # Check if gym dependent
@@ -469,29 +570,28 @@ class WorkoutVisualizer:
             is_dependent = bool(session_vol.iloc[0]['gym_dependent'])
 
         if not is_dependent:
-             session_vol['record_volume'] = session_vol['volume'].cummax()
+             session_vol['record_volume'] = np.maximum.accumulate(
+                 session_vol['volume'].to_numpy()
+             )
         else:
-             records = []
-             gym_maxes = {} # gym -> current record
-             
-             for _, row in session_vol.iterrows():
-                 gym = row.get('gym', 'Unknown')
-                 current_vol = row['volume']
-                 
-                 existing_max = gym_maxes.get(gym, 0.0)
-                 new_max = max(existing_max, current_vol)
-                 gym_maxes[gym] = new_max
-                 
-                 records.append(new_max)
-             
-             session_vol['record_volume'] = records
+             # Running max per gym, without iterating rows in Python
+             session_vol['gym'] = session_vol['gym'].fillna('Unknown')
+             session_vol['record_volume'] = (
+                 session_vol.groupby('gym', observed=True)['volume'].cummax()
+             )
         
         fig = go.Figure()
         
         # 1. All Workouts (Scatter)
-        fig.add_trace(go.Scatter(
-            x=session_vol['start_time'],
-            y=session_vol['volume'],
+        # numpy arrays (not Series) let plotly ship typed arrays as base64;
+        # multi-year dense traces get LTTB-downsampled before transfer
+        sess_x = session_vol['start_time'].to_numpy()
+        sess_y = session_vol['volume'].to_numpy()
+        if len(sess_x) > MAX_TRACE_POINTS:
+            sess_x, sess_y = _lttb_downsample(sess_x, sess_y)
+        fig.add_trace(go.Scattergl(
+            x=sess_x,
+            y=sess_y,
             mode='markers',
             name='Session Volume',
             marker=dict(color='#BDADEA', size=8, opacity=0.6),
@@ -501,9 +601,9 @@ class WorkoutVisualizer:
         # 2. Record Progression (Line)
         # We construct a step line for records
         if not is_dependent:
-            fig.add_trace(go.Scatter(
-                x=session_vol['start_time'],
-                y=session_vol['record_volume'],
+            fig.add_trace(go.Scattergl(
+                x=session_vol['start_time'].to_numpy(),
+                y=session_vol['record_volume'].to_numpy(),
                 mode='lines',
                 name='Volume Record',
                 line=dict(color='#ef476f', width=2, shape='hv'), # hv shape makes it a step function
@@ -511,18 +611,22 @@ class WorkoutVisualizer:
             ))
         else:
             # For dependent records, we need to break the line when the gym changes.
-            # We identify segments where the gym is continuous.
-            session_vol['gym'] = session_vol['gym'].fillna('Unknown')
-            # Create a group id that increments every time gym changes
-            session_vol['gym_group'] = (session_vol['gym'] != session_vol['gym'].shift()).cumsum()
-            
+            # Segment boundaries come from int gym codes; np.split then hands
+            # each trace a plain array slice instead of building one small
+            # DataFrame per segment via groupby
+            codes, _ = pd.factorize(session_vol['gym'])
+            splits = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+            seg_x = np.split(session_vol['start_time'].to_numpy(), splits)
+            seg_y = np.split(session_vol['record_volume'].to_numpy(), splits)
+
             # Using legendgroup to have one legend item toggle all segments
             show_legend = True
-            
-            for _, group_data in session_vol.groupby('gym_group'):
-                fig.add_trace(go.Scatter(
-                    x=group_data['start_time'],
-                    y=group_data['record_volume'],
+
+            segments = []
+            for xs, ys in zip(seg_x, seg_y):
+                segments.append(go.Scattergl(
+                    x=xs,
+                    y=ys,
                     mode='lines',
                     name='Volume Record',
                     legendgroup='records',
@@ -531,6 +635,7 @@ class WorkoutVisualizer:
                     hoverinfo='skip'
                 ))
                 show_legend = False # Only show first segment in legend
+            fig.add_traces(segments)
 
         # Highlights formatting
         fig.update_layout(
@@ -540,7 +645,9 @@ class WorkoutVisualizer:
             yaxis_title='Volume (kg)',
             hovermode='x unified',
             showlegend=True,
-            legend=dict(orientation="h", y=1.1, x=1, xanchor="right")
+            legend=dict(orientation="h", y=1.1, x=1, xanchor="right"),
+            uirevision='keep',
+            transition_duration=0
         )
         
         return fig
@@ -562,10 +669,23 @@ class WorkoutVisualizer:
         # Helper to calculate % distribution
         def get_distribution(df):
             if df.empty: return pd.Series()
-            df = df.copy()
-            df['major_group'] = df['muscle_group'].replace(GROUP_MAPPING)
-            # Use 'size' to count sets (rows), assuming 1 row = 1 set
-            set_count_by_group = df.groupby('major_group').size()
+            # Reuse the precomputed major_group when the frame carries it;
+            # no full-frame copy either way
+            if 'major_group' in df.columns:
+                groups = df['major_group']
+            else:
+                groups = map_major_group(df['muscle_group'])
+            # Count sets (rows) per group, 1 row = 1 set. On categoricals a
+            # raw bincount over the codes skips value_counts' hashtable and
+            # result sorting; the Series is only built over the few groups.
+            if isinstance(groups.dtype, pd.CategoricalDtype):
+                codes = groups.cat.codes.to_numpy()
+                counts = np.bincount(
+                    codes[codes >= 0], minlength=len(groups.cat.categories)
+                )
+                set_count_by_group = pd.Series(counts, index=groups.cat.categories)
+            else:
+                set_count_by_group = groups.value_counts()
             total_sets = set_count_by_group.sum()
             if total_sets == 0: return pd.Series()
             return (set_count_by_group / total_sets) * 100
@@ -603,30 +723,10 @@ class WorkoutVisualizer:
                 values_closed = values + [values[0]]
                 axes_closed = formatted_axes + [formatted_axes[0]]
                 
-                # Handle color for fill (make it more transparent)
-                # If it's already rgba, we want to lower the alpha.
-                # If it's rgb, convert to rgba with low alpha.
-                # Quick fix: If it starts with rgba, just use a hardcoded low opacity override or try to parse.
-                # Safe approach: always use rgba(r,g,b,0.1) if input is hex/rgb, but handling input rgba string is messy.
-                # Let's just use the provided color for fill but set opacity in Scatterpolar if possible?
-                # Scatterpolar 'opacity' affects line too. 'fillcolor' is separate.
-                
-                fill_col = color
-                if 'rgba' in color:
-                     # e.g. rgba(54, 162, 235, 0.6)
-                     # We want to replace 0.6 with 0.1
-                     # rsplit on comma
-                     parts = color.rsplit(',', 1)
-                     if len(parts) == 2:
-                         fill_col = parts[0] + ', 0.1)'
-                elif 'rgb' in color:
-                     fill_col = color.replace('rgb', 'rgba').replace(')', ', 0.1)')
-                else:
-                     # Hex or name
-                     # Leave as is or try to convert? Plotly handles hex.
-                     # To add opacity to hex, we can't easily do it in string without conversion.
-                     # For now, just use the color as is (it might be opaque).
-                     pass
+                # Handle color for fill (make it more transparent).
+                # The cached parser also converts hex inputs, which the old
+                # inline branches left fully opaque.
+                fill_col = _fill_rgba(color)
 
                 traces.append(go.Scatterpolar(
                     r=values_closed,
@@ -667,11 +767,14 @@ class WorkoutVisualizer:
             title=title,
             height=500,
             margin=dict(l=80, r=80, t=50, b=50),
-            legend=dict(orientation="h", y=-0.1) # Legend at bottom
+            legend=dict(orientation="h", y=-0.1), # Legend at bottom
+            uirevision='keep',
+            transition_duration=0
         )
         
         return fig
 
+    @_memoize_figure
     def create_consistency_heatmap(self, year=None):
         """
         Creates a GitHub-style consistency heatmap.
@@ -679,12 +782,10 @@ class WorkoutVisualizer:
         Y-axis: Days (Mon-Sun)
         Color: Volume (Intensity)
         """
-        plot_data = self.df.copy()
-        
+        plot_data = self._year_slice(year)
+
         # Date Logic
-        if year:
-            plot_data = plot_data[plot_data['start_time'].dt.year == year]
-        else:
+        if not year:
             # Default to last 365 days if All Time is selected, to avoid massive charts
             if not plot_data.empty:
                 max_date = plot_data['start_time'].max()
@@ -694,46 +795,39 @@ class WorkoutVisualizer:
         if plot_data.empty:
             return None
 
-        # Aggregate per day - Use SET COUNT instead of Volume
-        plot_data['date'] = plot_data['start_time'].dt.date
-        daily_metric = plot_data.groupby('date').size().reset_index(name='sets')
-        
-        # Create full date range to show empty days as grey/empty
-        min_date = daily_metric['date'].min()
-        max_date = daily_metric['date'].max()
-        all_dates = pd.date_range(start=min_date, end=max_date, freq='D').date
-        
-        # Merge with full range
-        full_df = pd.DataFrame({'date': all_dates})
-        full_df = pd.merge(full_df, daily_metric, on='date', how='left').fillna(0)
-        
-        # Prepare Coordinates
-        # y: Day of Week (Monday=0, Sunday=6) - We want Mon at top (0) or Sun at top?
-        # Usually GitHub has Sun/Mon at top. Let's put Mon (0) at Top.
-        # But Plotly Heatmap Y=0 is bottom by default unless reversed.
-        
-        full_df['datetime'] = pd.to_datetime(full_df['date'])
-        full_df['weekday'] = full_df['datetime'].dt.weekday # 0=Mon, 6=Sun
-        full_df['week_start'] = full_df['datetime'].apply(lambda d: d - pd.Timedelta(days=d.weekday()))
-        
-        # Heatmap
-        # We need to reshape for specific x,y,z or just pass columns.
-        
-        # Map weekday numbers to names for hover
-        days_map = {0:'Mon', 1:'Tue', 2:'Wed', 3:'Thu', 4:'Fri', 5:'Sat', 6:'Sun'}
-        full_df['day_name'] = full_df['weekday'].map(days_map)
-        
-        # Invert Y for visualization (Mon at top) -> actually with 'autorange="reversed"' in layout
-        
+        # Aggregate per day - Use SET COUNT instead of Volume.
+        # The datetime64[D] cast truncates to integer days-since-epoch
+        # regardless of the source resolution; a bincount over those does
+        # the count AND the fill-missing-days-with-zero in one C pass,
+        # replacing the date-object groupby plus the full-range merge.
+        days = plot_data['start_time'].to_numpy().astype('datetime64[D]').astype('int64')
+        first = int(days.min())
+        counts = np.bincount(days - first)
+
+        # Scatter the counts into a dense (7, weeks) matrix: go.Heatmap
+        # takes the numpy array directly and serializes one typed payload
+        # instead of three per-day columns. Row 0 = Monday; cells outside
+        # the history stay NaN and render as gaps.
+        day_idx = first + np.arange(len(counts))
+        first_monday = first - (first + 3) % 7  # epoch day 0 was a Thursday
+        week = (day_idx - first_monday) // 7
+        dow = (day_idx + 3) % 7                 # 0=Mon, 6=Sun
+        # float32 is the narrowest dtype that still carries the NaN gaps;
+        # halves the serialized payload vs float64
+        z = np.full((7, week[-1] + 1), np.nan, dtype=np.float32)
+        z[dow, week] = counts
+        week_starts = (first_monday + 7 * np.arange(z.shape[1])).astype('datetime64[D]')
+
         fig = go.Figure(data=go.Heatmap(
-            x=full_df['week_start'],
-            y=full_df['day_name'], # Or just weekday index
-            z=full_df['sets'],
+            x=week_starts,
+            y=_DAY_NAMES,
+            z=z,
             colorscale='Greens',
             showscale=False, # cleaner look? or True for reference
             xgap=2, # separate cells
             ygap=2,
-            hovertemplate='<b>%{y}</b>, %{x}<br>Sets: %{z:.0f}<extra></extra>'
+            hoverongaps=False,
+            hovertemplate=_HEATMAP_HOVER
         ))
 
         fig.update_layout(
@@ -741,8 +835,7 @@ class WorkoutVisualizer:
             height=200, # Compact height
             yaxis=dict(
                 title=None,
-                categoryorder='array',
-                categoryarray=['Sun', 'Sat', 'Fri', 'Thu', 'Wed', 'Tue', 'Mon'], # Mon at top
+                autorange='reversed', # Mon at top
                 showgrid=False,
                 zeroline=False
             ),
@@ -752,7 +845,9 @@ class WorkoutVisualizer:
                 zeroline=False,
                 tickformat='%b %d'
             ),
-            margin=dict(l=40, r=40, t=40, b=20)
+            margin=dict(l=40, r=40, t=40, b=20),
+            uirevision='keep',
+            transition_duration=0
         )
         
         return fig